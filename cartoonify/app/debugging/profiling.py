@@ -13,10 +13,11 @@ else:
     profiling = False
 
 def evaluation_point(snapshot_name):
-    if profiling:
+    # Skip the costly snapshot when its statistics would not be logged anyway.
+    if profiling and logging.getLogger().isEnabledFor(logging.DEBUG):
         snapshot = tracemalloc.take_snapshot()
         stats = snapshot.statistics('lineno')
         length = len(stats) if max_statistics == 0 else max_statistics
-        logging.debug("Profiling evaluation ({}):".format(snapshot_name))
+        logging.debug("Profiling evaluation (%s):", snapshot_name)
         for stat in stats[:length]:
             logging.debug(stat)
\ No newline at end of file
@@ -81,7 +81,7 @@ class ImageProcessor(object):
         """download a model file from the url and unzip it
         """
         import app.urllib
-        self._logger.info('downloading model: {}'.format(filename))
+        self._logger.info('downloading model: %s', filename)
         app.urllib.urlretrieve(url + filename, filename)
         tar_file = tarfile.open(filename)
         for file in tar_file.getmembers():
@@ -1,12 +1,26 @@
 import ssl
+import shutil
 import certifi
 from urllib import request
+from urllib.error import ContentTooShortError
+
+# Parse the CA bundle only once, the context is shared by all HTTPS connections.
+_ssl_context = ssl.create_default_context(cafile=certifi.where())
 
 def create_ssl_context():
-    return ssl.create_default_context(cafile=certifi.where())
+    return _ssl_context
 
 # SSL fix for some misconfigured devices.
 ssl._create_default_https_context = create_ssl_context
 
+# Downloads are tens of megabytes large, read them in 1 MiB blocks
+# instead of the 8 KiB blocks used by urllib.request.urlretrieve.
+download_block_size = 1 << 20
+
 def urlretrieve(url, path):
-    request.urlretrieve(url, path)
\ No newline at end of file
+    with request.urlopen(url) as response, open(path, 'wb') as f:
+        shutil.copyfileobj(response, f, download_block_size)
+        size = int(response.headers.get('Content-Length', -1))
+        if size >= 0 and f.tell() < size:
+            raise ContentTooShortError('retrieval incomplete: got only {} out of {} bytes'.format(f.tell(), size),
+                                       (path, response.headers))
\ No newline at end of file